@@ -38,6 +38,13 @@ const TEAM_PUBLIC_KEY_BYTES: &[u8] =
 /// for reasonable clock skew between systems.
 const NONCE_WINDOW_SECS: u64 = 30;
 
+/// Manifest field holding the Ed25519 signature over `sha256(canonical)`
+///
+/// Signed manifests carry it next to the legacy `signature` field (Ed25519
+/// over the canonical bytes) so engines that predate it keep verifying
+/// `signature`. See the rollout notes in `manifest/README.md`.
+pub const MANIFEST_SHA256_SIGNATURE_FIELD: &str = "signature_sha256";
+
 /// Envelope for secure message transmission
 ///
 /// An envelope contains a message payload along with cryptographic metadata
@@ -416,11 +423,13 @@ impl CryptoModule {
 
     /// Canonicalize a JSON manifest for signing/verification
     ///
-    /// Strips `signature` and `signed_at` fields, then serializes
+    /// Strips `signature`, `signed_at` and `signature_sha256` fields, then serializes
     /// as compact JSON with sorted keys (BTreeMap ordering from serde_json::Value).
     ///
     /// Both Python signer and Rust verifier must produce identical bytes:
-    /// - Python: `json.dumps(data, sort_keys=True, separators=(',', ':'))`
+    /// - Python: `orjson.dumps(data, option=orjson.OPT_SORT_KEYS)`, or
+    ///   `json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=False)`
+    ///   without orjson (compact, raw UTF-8)
     /// - Rust: `serde_json::to_string()` on Value (BTreeMap = sorted keys, compact)
     pub fn canonicalize_manifest(manifest_json: &[u8]) -> Result<Vec<u8>, EngineError> {
         let mut value: serde_json::Value = serde_json::from_slice(manifest_json)
@@ -430,11 +439,12 @@ impl CryptoModule {
         if let Some(obj) = value.as_object_mut() {
             obj.remove("signature");
             obj.remove("signed_at");
+            obj.remove(MANIFEST_SHA256_SIGNATURE_FIELD);
         }
 
         // serde_json::Value uses BTreeMap internally, so keys are already sorted alphabetically.
-        // to_string() produces compact JSON with no whitespace — matching Python's
-        // json.dumps(data, sort_keys=True, separators=(',', ':'))
+        // to_string() produces compact JSON with no whitespace and raw UTF-8 — matching
+        // sign-manifest.py's canonicalize()
         let canonical = serde_json::to_string(&value)
             .map_err(|e| EngineError::Config(format!("Failed to serialize manifest: {}", e)))?;
 
@@ -444,30 +454,42 @@ impl CryptoModule {
     /// Verify a manifest file: parse JSON, canonicalize, verify signature
     ///
     /// This is the high-level method that handles the full verification flow:
-    /// 1. Parse JSON to extract signature
+    /// 1. Parse JSON to extract signatures
     /// 2. Strip signature fields and canonicalize
-    /// 3. Verify the canonical bytes against the signature
+    /// 3. Verify `signature_sha256` over `sha256(canonical)` when present,
+    ///    otherwise verify the legacy `signature` over the canonical bytes
     pub fn verify_manifest_file(&self, manifest_json: &[u8]) -> Result<(), EngineError> {
         let value: serde_json::Value = serde_json::from_slice(manifest_json)
             .map_err(|e| EngineError::Config(format!("Invalid manifest JSON: {}", e)))?;
 
-        let signature = value
-            .get("signature")
-            .and_then(|s| s.as_str())
-            .ok_or_else(|| EngineError::Config("No signature in manifest".to_string()))?;
+        let signature = value.get("signature").and_then(|s| s.as_str());
+        let signature_sha256 = value
+            .get(MANIFEST_SHA256_SIGNATURE_FIELD)
+            .and_then(|s| s.as_str());
 
         // Check for dev/placeholder signatures
-        if signature.contains("PLACEHOLDER") || signature.contains("LOCAL_DEV") {
-            if Self::is_production() {
-                return Err(EngineError::InvalidSignature);
+        if let Some(signature) = signature {
+            if signature.contains("PLACEHOLDER") || signature.contains("LOCAL_DEV") {
+                if Self::is_production() {
+                    return Err(EngineError::InvalidSignature);
+                }
+                tracing::debug!("Accepting dev placeholder signature (non-production build)");
+                return Ok(());
             }
-            tracing::debug!("Accepting dev placeholder signature (non-production build)");
-            return Ok(());
         }
 
-        // Canonicalize and verify
+        // Canonicalize and verify. The legacy signature is made after
+        // `signature_sha256` is set, so stripping that field to force the
+        // legacy path breaks the legacy signature too.
         let canonical = Self::canonicalize_manifest(manifest_json)?;
-        self.verify_manifest(&canonical, signature)
+        match (signature_sha256, signature) {
+            (Some(signature_sha256), _) => {
+                let digest = Sha256::digest(&canonical);
+                self.verify_manifest(&digest, signature_sha256)
+            }
+            (None, Some(signature)) => self.verify_manifest(&canonical, signature),
+            (None, None) => Err(EngineError::Config("No signature in manifest".to_string())),
+        }
     }
 }
 
@@ -720,6 +742,36 @@ mod tests {
         assert!(!canonical_str.contains('\n'));
     }
 
+    #[test]
+    fn test_canonicalize_matches_python_signer() {
+        // Expected bytes pinned from sign-manifest.py's canonicalize(), which
+        // produces the same output with orjson and with the stdlib fallback.
+        // Covers escapes, non-ASCII (raw UTF-8, including `\u00e9` input),
+        // nested key ordering and all signature fields being stripped.
+        let manifest = r#"{
+  "version": "1.0.0",
+  "plugins": [
+    {
+      "id": "fs-read",
+      "name": "Café ☃ 日本",
+      "description": "tab\t nl\n quote\" backslash\\ slash\/ ctrl\u0001 escaped \u00e9 emoji 😀",
+      "size": 42,
+      "enabled": true,
+      "zeta": null,
+      "alpha": -7
+    }
+  ],
+  "core_tools": [],
+  "signature": "sig",
+  "signed_at": "2026-01-01T00:00:00Z",
+  "signature_sha256": "sig"
+}"#;
+        let expected = r#"{"core_tools":[],"plugins":[{"alpha":-7,"description":"tab\t nl\n quote\" backslash\\ slash/ ctrl\u0001 escaped é emoji 😀","enabled":true,"id":"fs-read","name":"Café ☃ 日本","size":42,"zeta":null}],"version":"1.0.0"}"#;
+
+        let canonical = CryptoModule::canonicalize_manifest(manifest.as_bytes()).unwrap();
+        assert_eq!(String::from_utf8(canonical).unwrap(), expected);
+    }
+
     #[test]
     fn test_verify_file_signature() {
         use ed25519_dalek::Signer;
@@ -740,6 +792,119 @@ mod tests {
         assert!(result.is_ok());
     }
 
+    /// Sign a manifest the way sign-manifest.py does: `signature_sha256` over
+    /// the digest first, then the legacy `signature` over the canonical bytes
+    /// as pre-`signature_sha256` engines compute them
+    fn sign_manifest_dual(signing_key: &SigningKey, manifest: &mut serde_json::Value) {
+        use ed25519_dalek::Signer;
+
+        let bytes = serde_json::to_vec(&*manifest).unwrap();
+        let canonical = CryptoModule::canonicalize_manifest(&bytes).unwrap();
+        let signature_sha256 = signing_key.sign(&Sha256::digest(&canonical));
+        manifest[MANIFEST_SHA256_SIGNATURE_FIELD] =
+            serde_json::json!(hex::encode(signature_sha256.to_bytes()));
+
+        let legacy_canonical = legacy_canonicalize(manifest);
+        let signature = signing_key.sign(&legacy_canonical);
+        manifest["signature"] = serde_json::json!(hex::encode(signature.to_bytes()));
+        manifest["signed_at"] = serde_json::json!("2026-01-01T00:00:00Z");
+    }
+
+    /// Canonicalization used by engines released before `signature_sha256`
+    fn legacy_canonicalize(manifest: &serde_json::Value) -> Vec<u8> {
+        let mut value = manifest.clone();
+        if let Some(obj) = value.as_object_mut() {
+            obj.remove("signature");
+            obj.remove("signed_at");
+        }
+        serde_json::to_vec(&value).unwrap()
+    }
+
+    #[test]
+    fn test_verify_manifest_file_sha256_signature() {
+        let (signing_key, crypto) = test_crypto();
+
+        let mut manifest = serde_json::json!({
+            "version": "1.0.0",
+            "plugins": []
+        });
+        sign_manifest_dual(&signing_key, &mut manifest);
+        let signed = serde_json::to_vec(&manifest).unwrap();
+        assert!(crypto.verify_manifest_file(&signed).is_ok());
+
+        // A bad signature_sha256 must fail even though `signature` is valid
+        manifest[MANIFEST_SHA256_SIGNATURE_FIELD] = serde_json::json!("ab".repeat(64));
+        let tampered = serde_json::to_vec(&manifest).unwrap();
+        assert!(crypto.verify_manifest_file(&tampered).is_err());
+    }
+
+    #[test]
+    fn test_verify_manifest_file_strip_sha256_signature_fails() {
+        let (signing_key, crypto) = test_crypto();
+
+        let mut manifest = serde_json::json!({
+            "version": "1.0.0",
+            "plugins": []
+        });
+        sign_manifest_dual(&signing_key, &mut manifest);
+
+        // Dropping signature_sha256 must not verify via the legacy signature
+        manifest
+            .as_object_mut()
+            .unwrap()
+            .remove(MANIFEST_SHA256_SIGNATURE_FIELD);
+        let stripped = serde_json::to_vec(&manifest).unwrap();
+        assert!(crypto.verify_manifest_file(&stripped).is_err());
+    }
+
+    #[test]
+    fn test_dual_signed_manifest_verifies_with_legacy_engine() {
+        let (signing_key, crypto) = test_crypto();
+
+        let mut manifest = serde_json::json!({
+            "version": "1.0.0",
+            "plugins": [{"id": "fs-read", "hash": "ab".repeat(32)}]
+        });
+        sign_manifest_dual(&signing_key, &mut manifest);
+
+        // What released engines do: strip signature/signed_at, verify `signature`
+        let signature = manifest["signature"].as_str().unwrap();
+        let legacy_canonical = legacy_canonicalize(&manifest);
+        assert!(crypto.verify_manifest(&legacy_canonical, signature).is_ok());
+    }
+
+    #[test]
+    fn test_verify_manifest_file_legacy_signature() {
+        use ed25519_dalek::Signer;
+
+        let (signing_key, crypto) = test_crypto();
+
+        let mut manifest = serde_json::json!({
+            "version": "1.0.0",
+            "plugins": []
+        });
+        let bytes = serde_json::to_vec(&manifest).unwrap();
+        let canonical = CryptoModule::canonicalize_manifest(&bytes).unwrap();
+
+        let signature = signing_key.sign(&canonical);
+        manifest["signature"] = serde_json::json!(hex::encode(signature.to_bytes()));
+        let signed = serde_json::to_vec(&manifest).unwrap();
+        assert!(crypto.verify_manifest_file(&signed).is_ok());
+    }
+
+    #[test]
+    fn test_verify_manifest_file_no_signature_fails() {
+        let (_, crypto) = test_crypto();
+
+        let manifest = serde_json::json!({
+            "version": "1.0.0",
+            "plugins": [],
+            "signature": null
+        });
+        let bytes = serde_json::to_vec(&manifest).unwrap();
+        assert!(crypto.verify_manifest_file(&bytes).is_err());
+    }
+
     #[test]
     fn test_verify_manifest_file_placeholder_dev() {
         let (_, crypto) = test_crypto();
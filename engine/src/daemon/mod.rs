@@ -595,17 +595,13 @@ impl DaemonManager {
             CryptoModule::new().map_err(|e| format!("Failed to initialize crypto: {}", e))?;
 
         // Verify manifest signature if present
-        if let Some(signature) = manifest.get("signature").and_then(|s| s.as_str()) {
-            // Verify signature over the manifest content (excluding signature field)
-            let mut manifest_for_verify = manifest.clone();
-            if let Some(obj) = manifest_for_verify.as_object_mut() {
-                obj.remove("signature");
-            }
-            let verify_bytes = serde_json::to_vec(&manifest_for_verify)
-                .map_err(|e| format!("Failed to serialize manifest for verification: {}", e))?;
-
+        let has_signature = ["signature", crate::crypto::MANIFEST_SHA256_SIGNATURE_FIELD]
+            .iter()
+            .any(|field| manifest.get(*field).and_then(|s| s.as_str()).is_some());
+        if has_signature {
+            // Canonicalizes (excluding signature fields) and prefers `signature_sha256`
             crypto
-                .verify_manifest(&verify_bytes, signature)
+                .verify_manifest_file(&manifest_bytes)
                 .map_err(|e| format!("Manifest signature verification failed: {}", e))?;
 
             tracing::info!("Manifest signature verified successfully");
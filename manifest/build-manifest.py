@@ -7,19 +7,114 @@ Generates manifest.json with all entries
 
 import hashlib
 import json
+import mmap
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
-def compute_sha256(file_path: Path) -> str:
-    """Compute SHA256 hash of a file"""
+try:
+    import orjson
+except ImportError:
+    # Optional: stdlib json is used as a slower fallback
+    orjson = None
+
+MANIFEST_VERSION = "1.0.0"
+
+HASH_CHUNK_SIZE = 1 << 22  # 4 MiB
+
+# Sidecar cache of file hashes keyed by (path, mtime_ns, size); bumping the
+# manifest version invalidates it
+HASH_CACHE_NAME = ".hash-cache.json"
+HASH_CACHE_SCHEMA = f"1:{MANIFEST_VERSION}"
+SHA256_HEX = re.compile(r"[0-9a-f]{64}")
+
+def describe_hash_backend() -> str:
+    """Describe which SHA256 implementation hashlib resolved to.
+
+    OpenSSL-backed hashes pick SHA-NI / ARMv8 SHA2 instructions at runtime
+    when the CPU supports them; the builtin fallback is scalar C.
+    """
+    backend = type(hashlib.new("sha256")).__module__
+    if backend != "_hashlib":
+        return f"builtin ({backend}), no hardware acceleration"
+    try:
+        import ssl
+        return ssl.OPENSSL_VERSION
+    except ImportError:
+        return "OpenSSL"
+
+def compute_sha256(file_path: Path, size: int) -> str:
+    """Compute SHA256 hash of a file whose size the caller already stat'ed"""
     sha256 = hashlib.sha256()
+    # mmap can't map empty files
+    if size == 0:
+        return sha256.hexdigest()
+
     with open(file_path, 'rb') as f:
-        while chunk := f.read(8192):
-            sha256.update(chunk)
+        # Map the file so pages go straight to hashlib without copies;
+        # slice in chunks to keep the working set bounded on huge files
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                memoryview(mm) as view:
+            for offset in range(0, len(view), HASH_CHUNK_SIZE):
+                sha256.update(view[offset:offset + HASH_CHUNK_SIZE])
     return sha256.hexdigest()
 
+def load_hash_cache(cache_path: Path) -> Dict[str, str]:
+    """Load cached file hashes, discarding caches from another schema"""
+    try:
+        with open(cache_path, 'r') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or data.get("schema") != HASH_CACHE_SCHEMA:
+        return {}
+    entries = data.get("entries")
+    if not isinstance(entries, dict):
+        return {}
+
+    # Cached hashes go straight into the signed manifest; drop anything that
+    # isn't a well-formed SHA256 hex digest
+    return {
+        key: value for key, value in entries.items()
+        if isinstance(value, str) and SHA256_HEX.fullmatch(value)
+    }
+
+def dump_json(data) -> bytes:
+    """Serialize to indented JSON bytes in one go"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+def write_atomic(path: Path, data: bytes):
+    """Write data with a single write, then rename over path.
+
+    Readers never see a partially written file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+def save_hash_cache(cache_path: Path, entries: Dict[str, str]):
+    """Atomically rewrite the hash cache"""
+    write_atomic(cache_path, dump_json({"schema": HASH_CACHE_SCHEMA, "entries": entries}))
+
+def hash_plugin(wasm_file: Path, st: os.stat_result,
+                cache: Dict[str, str]) -> Tuple[str, str, int]:
+    """Hash a plugin file and return (cache key, sha256, size)
+
+    `st` is the stat result already taken while scanning the directory.
+    Files whose (path, mtime, size) match a cache entry are not re-read.
+    """
+    key = f"{os.path.abspath(wasm_file)}|{st.st_mtime_ns}|{st.st_size}"
+    file_hash = cache.get(key) or compute_sha256(wasm_file, st.st_size)
+    return key, file_hash, st.st_size
+
 def find_plugins(base_dir: Path) -> List[Dict]:
     """Find all WASM plugins in target directory"""
     plugins = []
@@ -29,12 +124,30 @@ def find_plugins(base_dir: Path) -> List[Dict]:
         print(f"Warning: WASM directory not found: {wasm_dir}")
         return plugins
     
-    for wasm_file in wasm_dir.glob("*.wasm"):
-        # Skip deps directory files
-        if wasm_file.parent.name == "deps":
-            continue
-            
-        file_hash = compute_sha256(wasm_file)
+    # Stat each entry once while scanning; is_file() skips the deps directory
+    entries = []
+    with os.scandir(wasm_dir) as it:
+        for entry in it:
+            if not entry.name.endswith(".wasm") or not entry.is_file():
+                continue
+            entries.append((entry.path, entry.stat()))
+
+    # Sort so the manifest order is deterministic
+    entries.sort(key=lambda e: e[0])
+    wasm_files = [Path(path) for path, _ in entries]
+    stats = [st for _, st in entries]
+
+    cache_path = base_dir / "manifest" / HASH_CACHE_NAME
+    cache = load_hash_cache(cache_path)
+
+    # hashlib releases the GIL while hashing, so threads scale across cores
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(hash_plugin, wasm_files, stats, repeat(cache)))
+
+    # Only keep entries for files that still exist
+    save_hash_cache(cache_path, {key: file_hash for key, file_hash, _ in results})
+
+    for wasm_file, (_, file_hash, size) in zip(wasm_files, results):
         plugin_name = wasm_file.stem.replace('_', '-')
         
         plugins.append({
@@ -42,7 +155,7 @@ def find_plugins(base_dir: Path) -> List[Dict]:
             "version": "0.1.0",
             "path": f"plugins/{plugin_name}.wasm",
             "hash": file_hash,
-            "size": wasm_file.stat().st_size
+            "size": size
         })
         
         print(f"Found plugin: {plugin_name} (hash: {file_hash[:16]}...)")
@@ -58,16 +171,26 @@ def find_core_tools(base_dir: Path) -> List[Dict]:
     
     return tools
 
+# Duplicated in sign-manifest.py: the scripts have hyphenated names and run
+# standalone, so they can't import each other
+def get_rove_root() -> Path:
+    """Return the Rove root, honouring ROVE_ROOT to skip path resolution."""
+    root = os.environ.get("ROVE_ROOT")
+    if root:
+        return Path(root)
+    return Path(__file__).resolve().parents[1]
+
 def build_manifest(base_dir: Path, output_path: Path):
     """Build the complete manifest"""
     print("Building Rove manifest...")
     print(f"Base directory: {base_dir}")
+    print(f"SHA256 backend: {describe_hash_backend()}")
     
     plugins = find_plugins(base_dir)
     core_tools = find_core_tools(base_dir)
     
     manifest = {
-        "version": "1.0.0",
+        "version": MANIFEST_VERSION,
         "generated_at": "local-build",
         "plugins": plugins,
         "core_tools": core_tools,
@@ -75,9 +198,7 @@ def build_manifest(base_dir: Path, output_path: Path):
     }
     
     # Write manifest
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w') as f:
-        json.dump(manifest, f, indent=2)
+    write_atomic(output_path, dump_json(manifest))
     
     print(f"\nManifest written to: {output_path}")
     print(f"  Plugins: {len(plugins)}")
@@ -87,7 +208,7 @@ def build_manifest(base_dir: Path, output_path: Path):
 
 def main():
     # Get base directory (Rove root)
-    base_dir = Path(__file__).parent.parent.resolve()
+    base_dir = get_rove_root()
     output_path = base_dir / "manifest" / "manifest.json"
     
     try:
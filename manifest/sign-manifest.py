@@ -13,47 +13,93 @@ Usage:
   # Sign with key file:
   python3 sign-manifest.py --key-file path/to/private_key.hex --env prod
 
+  # Sign several manifests at once:
+  python3 sign-manifest.py --env prod --manifest a/manifest.json b/manifest.json
+
 The signing process:
   1. Load manifest JSON
-  2. Remove "signature" and "signed_at" fields
+  2. Remove "signature", "signed_at" and "signature_sha256" fields
   3. Serialize as canonical JSON: sorted keys, compact separators
-  4. Sign canonical bytes with Ed25519 private key
-  5. Write signature back to manifest
+  4. Sign the SHA-256 digest of the canonical bytes -> "signature_sha256"
+  5. Add "signature_sha256", re-serialize without "signature"/"signed_at"
+     and sign those bytes directly -> "signature" (legacy scheme)
+  6. Write both signatures back to manifest
+
+Engines released before "signature_sha256" only verify "signature"; newer
+engines verify "signature_sha256". Because the legacy signature covers
+"signature_sha256", stripping it doesn't downgrade a newer engine to the
+legacy check. See "Signature Rollout" in manifest/README.md.
 
 Canonical JSON format (must match Rust's serde_json::to_string on Value):
   - Keys sorted alphabetically
   - No whitespace: separators=(',', ':')
-  - Python: json.dumps(data, sort_keys=True, separators=(',', ':'))
+  - Non-ASCII characters emitted as raw UTF-8 (not \\u escapes)
+  - Python: orjson.dumps(data, option=orjson.OPT_SORT_KEYS), or
+    json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    when orjson is not installed
   - Rust: serde_json::to_string(&value) where Value uses BTreeMap
 """
 
+import hashlib
 import json
 import os
 import sys
 import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
+from typing import List, Tuple
+
+try:
+    import orjson
+except ImportError:
+    # Optional: stdlib json produces the same canonical bytes, just slower
+    orjson = None
+
+try:
+    from nacl.signing import SigningKey
+except ImportError:
+    # Only required for production signing
+    SigningKey = None
+
+# Ed25519 over sha256(canonical); must match MANIFEST_SHA256_SIGNATURE_FIELD
+# in engine/src/crypto/mod.rs
+SHA256_SIGNATURE_FIELD = "signature_sha256"
 
-def canonicalize(data: dict) -> bytes:
+# Fields excluded from the canonical bytes behind "signature_sha256"
+SIGNATURE_FIELDS = frozenset(("signature", "signed_at", SHA256_SIGNATURE_FIELD))
+
+# Fields excluded by engines that predate "signature_sha256"
+LEGACY_SIGNATURE_FIELDS = frozenset(("signature", "signed_at"))
+
+def canonicalize(data: dict, exclude: frozenset = SIGNATURE_FIELDS) -> bytes:
     """Produce canonical JSON bytes for signing.
 
-    Removes signature-related fields, then serializes with:
+    Removes the `exclude` fields, then serializes with:
     - Sorted keys (alphabetical)
     - Compact separators (no whitespace)
 
     This matches Rust's serde_json::to_string() on serde_json::Value
     (which uses BTreeMap for sorted keys).
     """
-    # Remove signature fields
-    clean = {k: v for k, v in data.items() if k not in ("signature", "signed_at")}
+    # Remove signature fields; only copy the top level when one is present
+    if exclude.isdisjoint(data):
+        clean = data
+    else:
+        clean = {k: v for k, v in data.items() if k not in exclude}
     # Canonical: sorted keys, compact
-    return json.dumps(clean, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    if orjson is not None:
+        return orjson.dumps(clean, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(
+        clean, sort_keys=True, separators=(',', ':'), ensure_ascii=False
+    ).encode('utf-8')
 
 
-def sign_bytes(data: bytes, private_key_hex: str) -> str:
-    """Sign data with Ed25519 private key, return hex signature."""
-    try:
-        from nacl.signing import SigningKey
-    except ImportError:
+@lru_cache(maxsize=None)
+def get_signing_key(private_key_hex: str) -> "SigningKey":
+    """Return a SigningKey for the hex private key, built once per key."""
+    if SigningKey is None:
         print("Error: PyNaCl is required for production signing.", file=sys.stderr)
         print("Install it with: pip install pynacl", file=sys.stderr)
         sys.exit(1)
@@ -63,8 +109,12 @@ def sign_bytes(data: bytes, private_key_hex: str) -> str:
         print(f"Error: Private key must be 32 bytes, got {len(private_key_bytes)}", file=sys.stderr)
         sys.exit(1)
 
-    signing_key = SigningKey(private_key_bytes)
-    signed = signing_key.sign(data)
+    return SigningKey(private_key_bytes)
+
+
+def sign_bytes(data: bytes, private_key_hex: str) -> str:
+    """Sign data with Ed25519 private key, return hex signature."""
+    signed = get_signing_key(private_key_hex).sign(data)
     return signed.signature.hex()
 
 
@@ -91,36 +141,119 @@ def load_private_key(key_file: str = None) -> str:
     return None
 
 
-def sign_manifest_prod(manifest_path: Path, private_key_hex: str):
-    """Sign manifest with real Ed25519 signature for production."""
-    print(f"Signing manifest (production mode): {manifest_path}")
+def write_manifest(manifest_path: Path, manifest: dict):
+    """Write the manifest with a single write and an atomic rename."""
+    if orjson is not None:
+        data = orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(manifest, indent=2).encode('utf-8')
+    tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, manifest_path)
+
+
+# Duplicated in build-manifest.py: the scripts have hyphenated names and run
+# standalone, so they can't import each other
+def get_rove_root() -> Path:
+    """Return the Rove root, honouring ROVE_ROOT to skip path resolution."""
+    root = os.environ.get("ROVE_ROOT")
+    if root:
+        return Path(root)
+    return Path(__file__).resolve().parents[1]
 
-    with open(manifest_path, 'r') as f:
-        manifest = json.load(f)
 
-    # Canonicalize
-    canonical = canonicalize(manifest)
-    print(f"  Canonical bytes: {len(canonical)} bytes")
+def utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string with a Z suffix."""
+    return (
+        datetime.datetime.now(datetime.timezone.utc)
+        .isoformat(timespec="seconds")
+        .replace("+00:00", "Z")
+    )
 
-    # Sign
-    signature = sign_bytes(canonical, private_key_hex)
-    print(f"  Signature: {signature[:32]}...")
 
-    # Write back
-    manifest["signature"] = signature
-    manifest["signed_at"] = datetime.datetime.utcnow().isoformat() + "Z"
+def sign_one(manifest: dict, private_key_hex: str) -> Tuple[str, str, str]:
+    """Sign a manifest dict without modifying it.
+
+    Returns (signature, signature_sha256, signed_at). The legacy signature
+    covers the manifest with "signature_sha256" set, so callers must set
+    both fields.
+    """
+    # One filtered top-level copy serves both signatures; canonicalize()
+    # takes its no-copy path on it each time
+    clean = {k: v for k, v in manifest.items() if k not in SIGNATURE_FIELDS}
 
-    with open(manifest_path, 'w') as f:
-        json.dump(manifest, f, indent=2)
+    # Sign the digest so only 32 bytes cross into libsodium
+    canonical = canonicalize(clean)
+    signature_sha256 = sign_bytes(hashlib.sha256(canonical).digest(), private_key_hex)
 
-    print(f"  Manifest signed successfully")
+    # Legacy signature, as verified by engines that predate signature_sha256
+    clean[SHA256_SIGNATURE_FIELD] = signature_sha256
+    signature = sign_bytes(canonicalize(clean, LEGACY_SIGNATURE_FIELDS), private_key_hex)
+    return signature, signature_sha256, utc_timestamp()
 
-    # Verify round-trip: re-read and re-canonicalize should produce same bytes
+
+def load_and_sign(manifest_path: Path, private_key_hex: str) -> Tuple[dict, str, str, str]:
+    """Load a manifest and sign it.
+
+    Returns (manifest, signature, signature_sha256, signed_at).
+    """
     with open(manifest_path, 'r') as f:
-        verify = json.load(f)
-    verify_canonical = canonicalize(verify)
-    assert verify_canonical == canonical, "Round-trip canonicalization mismatch!"
-    print(f"  Round-trip verification: OK")
+        manifest = json.load(f)
+    return (manifest, *sign_one(manifest, private_key_hex))
+
+
+def sign_many_manifests(manifest_paths: List[Path], private_key_hex: str):
+    """Sign manifests with real Ed25519 signatures for production.
+
+    Parsing, canonicalization, hashing and signing run on a thread pool
+    (hashlib and PyNaCl release the GIL); results are verified and written
+    in input order.
+    """
+    # Build the key once up front; SigningKey is safe to share across threads
+    signing_key = get_signing_key(private_key_hex)
+
+    for manifest_path in manifest_paths:
+        print(f"Signing manifest (production mode): {manifest_path}")
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(load_and_sign, manifest_paths, repeat(private_key_hex)))
+
+    for manifest_path, (manifest, signature, signature_sha256, signed_at) in zip(
+        manifest_paths, results
+    ):
+        print(f"Signed manifest: {manifest_path}")
+        print(f"  Signature (sha256): {signature_sha256[:32]}...")
+        print(f"  Signature (legacy): {signature[:32]}...")
+
+        # Inject signatures
+        manifest[SHA256_SIGNATURE_FIELD] = signature_sha256
+        manifest["signature"] = signature
+        manifest["signed_at"] = signed_at
+
+        # Verify round-trip in memory before writing: both signatures must
+        # hold over the re-canonicalized signed dict, as each engine sees it.
+        # Filter once for the legacy view, then drop signature_sha256 from
+        # that same copy for the current one.
+        clean = {k: v for k, v in manifest.items() if k not in LEGACY_SIGNATURE_FIELDS}
+        signing_key.verify_key.verify(
+            canonicalize(clean, LEGACY_SIGNATURE_FIELDS), bytes.fromhex(signature)
+        )
+        del clean[SHA256_SIGNATURE_FIELD]
+        canonical = canonicalize(clean)
+        print(f"  Canonical bytes: {len(canonical)} bytes")
+        signing_key.verify_key.verify(
+            hashlib.sha256(canonical).digest(), bytes.fromhex(signature_sha256)
+        )
+        print(f"  Round-trip verification: OK")
+
+        write_manifest(manifest_path, manifest)
+
+        print(f"  Manifest written")
+
+
+def sign_manifest_prod(manifest_path: Path, private_key_hex: str):
+    """Sign manifest with real Ed25519 signature for production."""
+    sign_many_manifests([manifest_path], private_key_hex)
 
 
 def sign_manifest_local(manifest_path: Path):
@@ -130,11 +263,12 @@ def sign_manifest_local(manifest_path: Path):
     with open(manifest_path, 'r') as f:
         manifest = json.load(f)
 
+    # A stale production signature_sha256 would take precedence over the placeholder
+    manifest.pop(SHA256_SIGNATURE_FIELD, None)
     manifest["signature"] = "LOCAL_DEV_PLACEHOLDER_SIGNATURE"
     manifest["signed_at"] = "local-development"
 
-    with open(manifest_path, 'w') as f:
-        json.dump(manifest, f, indent=2)
+    write_manifest(manifest_path, manifest)
 
     print(f"  Manifest signed with dev placeholder")
     print("  Note: Production builds require a real Ed25519 signature")
@@ -147,20 +281,22 @@ def main():
     parser.add_argument("--env", choices=["dev", "prod"], default="dev",
                        help="Environment: dev (placeholder) or prod (real signature)")
     parser.add_argument("--key-file", help="Path to private key file (.hex or .bin)")
-    parser.add_argument("--manifest", help="Path to manifest.json (default: auto-detect)")
+    parser.add_argument("--manifest", nargs="+",
+                       help="Path(s) to manifest.json (default: auto-detect)")
     args = parser.parse_args()
 
-    # Find manifest
+    # Find manifests
     if args.manifest:
-        manifest_path = Path(args.manifest)
+        manifest_paths = [Path(p) for p in args.manifest]
     else:
-        base_dir = Path(__file__).parent.parent.resolve()
-        manifest_path = base_dir / "manifest" / "manifest.json"
+        base_dir = get_rove_root()
+        manifest_paths = [base_dir / "manifest" / "manifest.json"]
 
-    if not manifest_path.exists():
-        print(f"Error: Manifest not found: {manifest_path}", file=sys.stderr)
-        print("Run build-manifest.py first", file=sys.stderr)
-        return 1
+    for manifest_path in manifest_paths:
+        if not manifest_path.exists():
+            print(f"Error: Manifest not found: {manifest_path}", file=sys.stderr)
+            print("Run build-manifest.py first", file=sys.stderr)
+            return 1
 
     try:
         if args.env == "prod":
@@ -169,9 +305,10 @@ def main():
                 print("Error: No private key found for production signing.", file=sys.stderr)
                 print("Provide via ROVE_SIGNING_KEY env var or --key-file", file=sys.stderr)
                 return 1
-            sign_manifest_prod(manifest_path, private_key)
+            sign_many_manifests(manifest_paths, private_key)
         else:
-            sign_manifest_local(manifest_path)
+            for manifest_path in manifest_paths:
+                sign_manifest_local(manifest_path)
         return 0
     except Exception as e:
         print(f"Error signing manifest: {e}", file=sys.stderr)
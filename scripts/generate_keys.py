@@ -6,31 +6,58 @@ Saves the Private Keys directly to macOS Keychain.
 Asks for requirements first, then outputs keys in a table.
 """
 
+import re
 import subprocess
 import sys
 
-def run_cmd(cmd, input_data=None):
+try:
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+except ImportError:
+    print("Error: the 'cryptography' package is required.")
+    print("Install it with: pip install cryptography")
+    sys.exit(1)
+
+# Matches PEM "-----BEGIN ...-----" / "-----END ...-----" lines
+PEM_BOUNDARY = re.compile(r"-----[^\n]*-----\n?")
+
+def generate_ed25519():
+    # Generated in-process; no openssl subprocesses or PEM round-trip
+    key = Ed25519PrivateKey.generate()
+    priv_key = key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+    pub_key = key.public_key().public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode()
+    return priv_key.strip(), pub_key.strip()
+
+def save_to_keychain(items):
+    """Save (service, account, secret) items with a single `security` process.
+
+    Commands are fed to `security -i` on stdin so secrets never appear in
+    argv (and therefore never in process listings). Secrets are passed
+    hex-encoded via -X since PEM values contain newlines.
+    """
+    # -U updates the item if it already exists
+    commands = "".join(
+        f'add-generic-password -s "{service}" -a "{account}" -X {secret.encode().hex()} -U\n'
+        for service, account, secret in items
+    )
     process = subprocess.run(
-        cmd,
-        input=input_data,
+        ["security", "-i"],
+        input=commands,
         capture_output=True,
         text=True
     )
-    if process.returncode != 0:
-        print(f"Error running command: {' '.join(cmd)}")
+    # Interactive mode keeps going after a failed command, so check stderr too
+    if process.returncode != 0 or process.stderr.strip():
+        print("Error saving keys to Keychain")
         print(process.stderr)
         sys.exit(1)
-    return process.stdout
-
-def generate_ed25519():
-    priv_key = run_cmd(["openssl", "genpkey", "-algorithm", "ed25519"])
-    pub_key = run_cmd(["openssl", "pkey", "-pubout"], input_data=priv_key)
-    return priv_key.strip(), pub_key.strip()
-
-def save_to_keychain(service: str, account: str, secret: str):
-    # -U updates the item if it already exists
-    cmd = ["security", "add-generic-password", "-s", service, "-a", account, "-w", secret, "-U"]
-    run_cmd(cmd)
 
 def main():
     print("======================================================")
@@ -71,13 +98,14 @@ def main():
     print("\nGenerating keys in memory and saving to Keychain...")
 
     results = []
+    keychain_items = []
     for k in selected_keys:
         priv, pub = generate_ed25519()
         k_for = k["for"]
 
-        # Save to keychain
+        # Queue for keychain
         service_name = f"rove-{k_for}-key-{env}"
-        save_to_keychain(service_name, "rove-engine", priv)
+        keychain_items.append((service_name, "rove-engine", priv))
 
         # Formatted names
         priv_name = f"{env}_private_{k_for}_key".upper()
@@ -86,16 +114,17 @@ def main():
         results.append((priv_name, priv))
         results.append((pub_name, pub))
 
+    # Save all private keys in one go
+    save_to_keychain(keychain_items)
+
     # Print results in .env format
     print("\n" + "=" * 80)
     print("  .env FORMAT OUTPUT (Ready to import into Infisical/Vault)")
     print("=" * 80 + "\n")
 
     for name, value in results:
-        # Strip the BEGIN and END lines entirely
-        clean_lines = [line for line in value.split('\n') if not line.startswith("-----")]
-        # Join into a single continuous base64 string
-        clean_value = "".join(clean_lines).strip()
+        # Strip the BEGIN and END lines, then join into one base64 string
+        clean_value = PEM_BOUNDARY.sub("", value).replace("\n", "").strip()
         print(f'{name}="{clean_value}"')
 
     print("\n" + "=" * 80)